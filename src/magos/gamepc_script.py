@@ -14,15 +14,16 @@ from typing import (
     cast,
 )
 
-from magos.stream import (
-    read_uint16be,
-    read_uint32be,
-    write_uint16be,
-    write_uint32be,
-)
+from magos.stream import UINT16BE, UINT32BE
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+    PropertyReader = Callable[
+        [memoryview, int, dict[int, set[int]] | None],
+        tuple['Property', int],
+    ]
+    ParamReader = Callable[[memoryview, int, str, int], tuple['Param', int]]
 
 DWORD_MASK = 0xFFFFFFFF
 WORD_MASK = 0xFFFF
@@ -30,14 +31,19 @@ BYTE_MASK = 0xFF
 
 BASE_MIN = 0x8000
 
+# item references are stored offset by 2 and read back as words
+ITEM_NUMBERS = range(2, WORD_MASK + 1)
+
+WORD_PTYPES = frozenset({'v', 'p', 'n', 'a', 'S', 'N'})
 
-def read_item(stream: IO[bytes]) -> int:
-    val = read_uint32be(stream)
-    return 0 if val == DWORD_MASK else val + 2
+
+def read_item(buf: memoryview, offset: int) -> int:
+    (val,) = UINT32BE.unpack_from(buf, offset)
+    return 0 if val == DWORD_MASK else cast(int, val) + 2
 
 
 def write_item(num: int) -> bytes:
-    return write_uint32be(DWORD_MASK if num == 0 else num - 2)
+    return UINT32BE.pack(DWORD_MASK if num == 0 else num - 2)
 
 
 class ItemType(IntEnum):
@@ -50,6 +56,9 @@ class ItemType(IntEnum):
     INHERIT = 255
 
 
+ITEM_TYPES = {item_type.value: item_type for item_type in ItemType}
+
+
 class PropertyType(IntEnum):
     DESCRIPTION = 0
     SIZE = 1
@@ -63,12 +72,24 @@ class PropertyType(IntEnum):
     FLAGS = 17
 
 
+PROPERTY_TYPES = frozenset(PropertyType)
+WORD_PROPERTIES = tuple(
+    (key, 1 << key)
+    for key in PropertyType
+    if key not in {PropertyType.DESCRIPTION, PropertyType.FLAGS}
+)
+
+
 class DoorState(IntEnum):
     OPEN = 1
     CLOSED = 2
     LOCKED = 3
 
 
+# indexed by the 2-bit exit status, where 0 marks a missing exit
+DOOR_STATES = (None, *DoorState)
+
+
 class Exit(TypedDict):
     exit_to: int
     status: DoorState
@@ -80,28 +101,46 @@ class RoomProperty(TypedDict):
     exits: Sequence[Exit | None]
 
 
-def read_room(stream: IO[bytes]) -> RoomProperty:
-    table = read_uint16be(stream)
-    exit_states = read_uint16be(stream)
+ROOM_HEADER = struct.Struct('>2H')
+ROOM_LAYOUTS = tuple(struct.Struct(f'>2H{count}I') for count in range(7))
+EXIT_KEYS = tuple(f'EXIT{idx}' for idx in range(1, 7))
+
+
+def read_room(
+    buf: memoryview,
+    offset: int,
+    soundmap: dict[int, set[int]] | None = None,
+) -> tuple[RoomProperty, int]:
+    table, exit_states = ROOM_HEADER.unpack_from(buf, offset)
+    offset += ROOM_HEADER.size
 
     exits: list[Exit | None] = []
+    unpack_u32 = UINT32BE.unpack_from
 
-    for _ in range(6):
+    for shift in range(0, 12, 2):
+        door_state = DOOR_STATES[(exit_states >> shift) & 3]
         ex: Exit | None = None
-        if exit_states & 3 != 0:
-            ex = Exit(
-                exit_to=read_item(stream),
-                status=DoorState(exit_states & 3),
-            )
-            assert ex['exit_to'] != 0
+        if door_state is not None:
+            (exit_to,) = unpack_u32(buf, offset)
+            offset += UINT32BE.size
+            assert exit_to != DWORD_MASK
+            ex = {'exit_to': exit_to + 2, 'status': door_state}
         exits.append(ex)
-        exit_states >>= 2
 
-    return RoomProperty(
-        ptype=ItemType.ROOM,
-        table=table,
-        exits=exits,
-    )
+    room: RoomProperty = {
+        'ptype': ItemType.ROOM,
+        'table': table,
+        'exits': exits,
+    }
+    return room, offset
+
+
+# flags, optional description, word properties and name
+OBJECT_LAYOUTS = {
+    (described, count): struct.Struct(f'>{1 + described}I{count}HI')
+    for described in (False, True)
+    for count in range(len(WORD_PROPERTIES) + 1)
+}
 
 
 class ObjectProperty(TypedDict):
@@ -111,21 +150,29 @@ class ObjectProperty(TypedDict):
 
 
 def read_object_property(
-    stream: IO[bytes],
+    buf: memoryview,
+    offset: int,
     soundmap: dict[int, set[int]] | None = None,
-) -> ObjectProperty:
+) -> tuple[ObjectProperty, int]:
     params: 'dict[PropertyType, int | Param]' = {}
 
-    flags = read_uint32be(stream)
+    (flags,) = UINT32BE.unpack_from(buf, offset)
+    offset += UINT32BE.size
 
     text = None
     if flags & 1:
-        text = Param('T', read_uint32be(stream))
+        text = Param('T', UINT32BE.unpack_from(buf, offset)[0])
+        offset += UINT32BE.size
         params[PropertyType(0)] = text
 
-    for n in range(1, 16):
-        if flags & (1 << n) != 0:
-            params[PropertyType(n)] = read_uint16be(stream)
+    # visit only the set bits of the word-sized properties, lowest first
+    bits = flags & 0xFFFE
+    while bits:
+        bit = bits & -bits
+        key = PropertyType(bit.bit_length() - 1)
+        (params[key],) = UINT16BE.unpack_from(buf, offset)
+        offset += UINT16BE.size
+        bits ^= bit
 
     flags >>= 16
     if flags:
@@ -136,13 +183,15 @@ def read_object_property(
         if voice is not None:
             assert isinstance(voice, int)
             soundmap[text.value].add(voice)
-    name = Param('T', read_uint32be(stream))
+    name = Param('T', UINT32BE.unpack_from(buf, offset)[0])
+    offset += UINT32BE.size
 
-    return ObjectProperty(
-        ptype=ItemType.OBJECT,
-        params=params,
-        name=name,
-    )
+    obj: ObjectProperty = {
+        'ptype': ItemType.OBJECT,
+        'params': params,
+        'name': name,
+    }
+    return obj, offset
 
 
 class UserFlagProperty(TypedDict):
@@ -153,6 +202,9 @@ class UserFlagProperty(TypedDict):
     flag4: int
 
 
+USER_FLAGS = struct.Struct('>4H')
+
+
 class InheritProperty(TypedDict):
     ptype: Literal[ItemType.INHERIT]
     item: int
@@ -161,7 +213,8 @@ class InheritProperty(TypedDict):
 Property = RoomProperty | ObjectProperty | UserFlagProperty | InheritProperty
 
 
-class Item(TypedDict):
+@dataclass(slots=True)
+class Item:
     adjective: int
     noun: int
     state: int
@@ -174,35 +227,55 @@ class Item(TypedDict):
     properties: Sequence[Property]
 
 
+ITEM_HEADER = struct.Struct('>3H3I2HI')
+
+
+def read_user_flag(
+    buf: memoryview,
+    offset: int,
+    soundmap: dict[int, set[int]] | None = None,
+) -> tuple[UserFlagProperty, int]:
+    flag1, flag2, flag3, flag4 = USER_FLAGS.unpack_from(buf, offset)
+    user_flag: UserFlagProperty = {
+        'ptype': ItemType.USERFLAG,
+        'flag1': flag1,
+        'flag2': flag2,
+        'flag3': flag3,
+        'flag4': flag4,
+    }
+    return user_flag, offset + USER_FLAGS.size
+
+
+def read_inherit(
+    buf: memoryview,
+    offset: int,
+    soundmap: dict[int, set[int]] | None = None,
+) -> tuple[InheritProperty, int]:
+    inherit: InheritProperty = {
+        'ptype': ItemType.INHERIT,
+        'item': read_item(buf, offset),
+    }
+    return inherit, offset + UINT32BE.size
+
+
+PROPERTY_READERS: 'Mapping[ItemType, PropertyReader]' = {
+    ItemType.ROOM: read_room,
+    ItemType.OBJECT: read_object_property,
+    ItemType.USERFLAG: read_user_flag,
+    ItemType.INHERIT: read_inherit,
+}
+
+
 def read_properties(
-    stream: IO[bytes],
+    buf: memoryview,
+    offset: int,
     ptype: ItemType,
     soundmap: dict[int, set[int]] | None = None,
-) -> Property:
-    if ptype == ItemType.ROOM:
-        return read_room(stream)
-    if ptype == ItemType.OBJECT:
-        return read_object_property(stream, soundmap=soundmap)
-    if ptype == ItemType.PLAYER:
-        raise NotImplementedError('KEY_PLAYER')
-    if ptype == ItemType.SUPER_ROOM:
-        raise NotImplementedError('KEY_SUPER_ROOM')
-    if ptype == ItemType.CHAIN:
-        raise NotImplementedError('KEY_CHAIN')
-    if ptype == ItemType.USERFLAG:
-        return UserFlagProperty(
-            ptype=ItemType.USERFLAG,
-            flag1=read_uint16be(stream),
-            flag2=read_uint16be(stream),
-            flag3=read_uint16be(stream),
-            flag4=read_uint16be(stream),
-        )
-    if ptype == ItemType.INHERIT:
-        return InheritProperty(
-            ptype=ItemType.INHERIT,
-            item=read_item(stream),
-        )
-    raise NotImplementedError(ptype)
+) -> tuple[Property, int]:
+    reader = PROPERTY_READERS.get(ptype)
+    if reader is None:
+        raise NotImplementedError(f'KEY_{ptype.name}')
+    return reader(buf, offset, soundmap)
 
 
 def read_objects(
@@ -210,110 +283,174 @@ def read_objects(
     item_count: int,
     soundmap: dict[int, set[int]] | None = None,
 ) -> Sequence[Item]:
-    return [read_object(stream, soundmap=soundmap) for i in range(2, item_count)]
+    start = stream.tell()
+    buf = memoryview(stream.read())
+    offset = 0
+    read = read_object
+    objects: list[Item] = []
+    append = objects.append
+    for _ in range(2, item_count):
+        obj, offset = read(buf, offset, soundmap)
+        append(obj)
+    stream.seek(start + offset)
+    return objects
 
 
 def read_object(
-    stream: IO[bytes],
+    buf: memoryview,
+    offset: int,
     soundmap: dict[int, set[int]] | None = None,
-) -> Item:
-    adjective = read_uint16be(stream)
-    noun = read_uint16be(stream)
-    state = read_uint16be(stream)
-    next_item = read_item(stream)
-    child = read_item(stream)
-    parent = read_item(stream)
-    unk = read_uint16be(stream)
-    item_class = read_uint16be(stream)
-    properties_init = read_uint32be(stream)
-    properties = []
-    props = properties_init
-    while props:
-        props = read_uint16be(stream)
-        if props != 0:
-            ptype = ItemType(props)
-            properties.append(read_properties(stream, ptype, soundmap=soundmap))
-    return Item(
+) -> tuple[Item, int]:
+    (
+        adjective,
+        noun,
+        state,
+        next_item,
+        child,
+        parent,
+        unk,
+        item_class,
+        properties_init,
+    ) = ITEM_HEADER.unpack_from(buf, offset)
+    offset += ITEM_HEADER.size
+    properties: list[Property] = []
+    if properties_init:
+        u16 = UINT16BE.unpack_from
+        append = properties.append
+        item_type = ITEM_TYPES.get
+        while (props := u16(buf, offset)[0]) != 0:
+            ptype = item_type(props)
+            if ptype is None:
+                raise ValueError(props)
+            prop, offset = read_properties(buf, offset + 2, ptype, soundmap)
+            append(prop)
+        offset += UINT16BE.size
+    item = Item(
         adjective=adjective,
         noun=noun,
         state=state,
-        next_item=next_item,
-        child=child,
-        parent=parent,
+        next_item=0 if next_item == DWORD_MASK else next_item + 2,
+        child=0 if child == DWORD_MASK else child + 2,
+        parent=0 if parent == DWORD_MASK else parent + 2,
         unk=unk,
         item_class=item_class,
         properties_init=properties_init,
         properties=properties,
     )
+    return item, offset
 
 
 def write_room(prop: RoomProperty) -> bytes:
     exit_states = 0
-    sout = bytearray()
-    for ex in prop['exits'][::-1]:
-        exit_states <<= 2
+    exits = []
+    for idx, ex in enumerate(prop['exits']):
         if ex is not None:
             assert ex['status'] != 0, ex
-            sout = bytearray(write_item(ex['exit_to']) + sout)
-            exit_states |= ex['status']
-    return write_uint16be(prop['table']) + write_uint16be(exit_states) + bytes(sout)
+            exit_to = ex['exit_to']
+            exits.append(exit_to - 2 if exit_to else DWORD_MASK)
+            exit_states |= ex['status'] << (2 * idx)
+    return ROOM_LAYOUTS[len(exits)].pack(prop['table'], exit_states, *exits)
 
 
 def write_object_property(prop: ObjectProperty) -> bytes:
-    sout = bytearray()
-    flags = cast(int, prop['params'].pop(PropertyType.FLAGS, 0)) << 16
-    for key in PropertyType:
-        val = prop['params'].pop(key, None)
+    params = prop['params']
+    assert params.keys() <= PROPERTY_TYPES, params
+    flags = cast(int, params.get(PropertyType.FLAGS, 0)) << 16
+    values: list[int] = []
+    description = params.get(PropertyType.DESCRIPTION)
+    described = description is not None
+    if described:
+        flags |= 1
+        values.append(cast(Param, description).value)
+    for key, bit in WORD_PROPERTIES:
+        val = params.get(key)
         if val is not None:
-            flags |= 2**key
-            sout += (
-                write_uint32be(cast(Param, val).value)
-                if key == 0
-                else write_uint16be(cast(int, val))
-            )
-    assert not prop['params'], prop['params']
-    return write_uint32be(flags) + bytes(sout) + write_uint32be(prop['name'].value)
+            flags |= bit
+            values.append(cast(int, val))
+    layout = OBJECT_LAYOUTS[described, len(values) - described]
+    return layout.pack(flags, *values, prop['name'].value)
 
 
 def write_user_flag(prop: UserFlagProperty) -> bytes:
-    return (
-        write_uint16be(prop['flag1'])
-        + write_uint16be(prop['flag2'])
-        + write_uint16be(prop['flag3'])
-        + write_uint16be(prop['flag4'])
+    return USER_FLAGS.pack(
+        prop['flag1'],
+        prop['flag2'],
+        prop['flag3'],
+        prop['flag4'],
     )
 
 
+def write_inherit(prop: InheritProperty) -> bytes:
+    return write_item(prop['item'])
+
+
+PROPERTY_WRITERS: 'Mapping[ItemType, Callable[[Any], bytes]]' = {
+    ItemType.ROOM: write_room,
+    ItemType.OBJECT: write_object_property,
+    ItemType.USERFLAG: write_user_flag,
+    ItemType.INHERIT: write_inherit,
+}
+
+
 def write_objects_bytes(objects: Sequence[Item]) -> bytes:
-    output = bytearray()
+    pack_header = ITEM_HEADER.pack
+    pack_u16 = UINT16BE.pack
+    chunks: list[bytes] = []
+    write = chunks.append
     for obj in objects:
-        output += write_uint16be(obj['adjective'])
-        output += write_uint16be(obj['noun'])
-        output += write_uint16be(obj['state'])
-        output += write_item(obj['next_item'])
-        output += write_item(obj['child'])
-        output += write_item(obj['parent'])
-        output += write_uint16be(obj['unk'])
-        output += write_uint16be(obj['item_class'])
-        output += write_uint32be(obj['properties_init'])
-        for prop in obj['properties']:
-            output += write_uint16be(prop['ptype'])
-            if prop['ptype'] == ItemType.ROOM:
-                output += write_room(prop)
-            elif prop['ptype'] == ItemType.OBJECT:
-                output += write_object_property(prop)
-            elif prop['ptype'] == ItemType.INHERIT:
-                output += write_item(prop['item'])
-            elif prop['ptype'] == ItemType.USERFLAG:
-                output += write_user_flag(prop)
-            else:
+        next_item, child, parent = obj.next_item, obj.child, obj.parent
+        write(
+            pack_header(
+                obj.adjective,
+                obj.noun,
+                obj.state,
+                next_item - 2 if next_item else DWORD_MASK,
+                child - 2 if child else DWORD_MASK,
+                parent - 2 if parent else DWORD_MASK,
+                obj.unk,
+                obj.item_class,
+                obj.properties_init,
+            ),
+        )
+        for prop in obj.properties:
+            writer = PROPERTY_WRITERS.get(prop['ptype'])
+            if writer is None:
                 raise ValueError(prop)
-        if obj['properties']:
-            output += write_uint16be(0)
-    return bytes(output)
-
-
-@dataclass
+            write(pack_u16(prop['ptype']))
+            write(writer(prop))
+        if obj.properties:
+            write(b'\0\0')
+    # join sizes the output once, without regrowing or a final copy
+    return b''.join(chunks)
+
+
+TAGGED_DWORD = struct.Struct('>HI')
+SPECIAL_TEXTS = {
+    -1: b'\x00\x00',
+    -3: b'\x00\x03',
+}
+SPECIAL_ITEMS = {
+    '$1': b'\x00\x01',  # SUBJECT_ITEM
+    '$2': b'\x00\x03',  # OBJECT_ITEM
+    '$ME': b'\x00\x05',  # ME_ITEM
+    '$AC': b'\x00\x07',  # ACTOR_ITEM
+    '$RM': b'\x00\x09',  # ITEM_A_PARENT
+}
+TEXT_TAGS = {
+    0: -1,
+    3: -3,
+    1: 1,
+}
+ITEM_TAGS = {
+    1: '$1',  # SUBJECT_ITEM
+    3: '$2',  # OBJECT_ITEM
+    5: '$ME',  # ME_ITEM
+    7: '$AC',  # ACTOR_ITEM
+    9: '$RM',  # ITEM_A_PARENT
+}
+
+
+@dataclass(slots=True)
 class Param:
     ptype: str
     value: Any
@@ -334,66 +471,62 @@ class Param:
         return ''
 
     def __bytes__(self) -> bytes:
-        if self.ptype == 'T':
-            assert isinstance(self.value, int)
-            rtypes = {-1: 0, -3: 3}
-            special = rtypes.get(self.value, 1)
-            rtype = special.to_bytes(2, byteorder='big', signed=False)
-            value = b''
-            if special == 1:
-                value = self.value.to_bytes(4, byteorder='big', signed=False)
-            return rtype + value
-
-        if self.ptype == 'B':
-            return (
-                bytes([BYTE_MASK, *self.value])
-                if isinstance(self.value, list)
-                else bytes([self.value])
-            )
+        encode = PARAM_ENCODERS.get(self.ptype)
+        if encode is None:
+            raise ValueError(self.ptype)
+        return encode(self)
+
+
+def encode_text(param: Param) -> bytes:
+    assert isinstance(param.value, int)
+    special = SPECIAL_TEXTS.get(param.value)
+    if special is not None:
+        return special
+    return TAGGED_DWORD.pack(1, param.value)
+
+
+def encode_byte(param: Param) -> bytes:
+    return (
+        bytes([BYTE_MASK, *param.value])
+        if isinstance(param.value, list)
+        else bytes([param.value])
+    )
+
+
+def encode_item(param: Param) -> bytes:
+    special = SPECIAL_ITEMS.get(param.value)
+    if special is not None:
+        return special
+    return TAGGED_DWORD.pack(0, int(param.value[1:-1]) - 2)
 
-        if self.ptype == 'I':
-            special_items = {
-                '$1': 1,  # SUBJECT_ITEM
-                '$2': 3,  # OBJECT_ITEM
-                '$ME': 5,  # ME_ITEM
-                '$AC': 7,  # ACTOR_ITEM
-                '$RM': 9,  # ITEM_A_PARENT
-            }
-            special = special_items.get(self.value, 0)
-            rtype = special.to_bytes(2, byteorder='big', signed=False)
-            value = b''
-            if special == 0:
-                num = int(self.value[1:-1]) - 2
-                value = num.to_bytes(4, byteorder='big', signed=False)
-            return rtype + value
-
-        if self.ptype in {
-            'v',
-            'p',
-            'n',
-            'a',
-            'S',
-            'N',
-        }:
-            assert isinstance(self.value, int)
-            return self.value.to_bytes(2, byteorder='big', signed=False)
-
-        raise ValueError(self.ptype)
+
+def encode_word(param: Param) -> bytes:
+    assert isinstance(param.value, int)
+    return UINT16BE.pack(param.value)
+
+
+PARAM_ENCODERS: 'Mapping[str, Callable[[Param], bytes]]' = {
+    'T': encode_text,
+    'B': encode_byte,
+    'I': encode_item,
+    **dict.fromkeys(WORD_PTYPES, encode_word),
+}
 
 
 MIA_OP = 'UNKNOWN_OP'
 ops_mia: Counter[int] = Counter()
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     opcode: int
     cmd: str | None
     args: Sequence[Param]
+    packer: struct.Struct | None = field(default=None, compare=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.cmd is None:
-            ops_mia.update({self.opcode: 1})
+            ops_mia[self.opcode] += 1
 
     def __str__(self) -> str:
         cmd = f'(0x{self.opcode:02x}) {self.cmd or MIA_OP}'
@@ -407,10 +540,12 @@ class Command:
         return ' '.join(str(x) for x in (cmd, *self.args)) + comments
 
     def __bytes__(self) -> bytes:
-        return bytes([self.opcode]) + b''.join(bytes(p) for p in self.args)
+        if self.packer is not None:
+            return self.packer.pack(self.opcode, *(p.value for p in self.args))
+        return bytes([self.opcode]) + b''.join([bytes(p) for p in self.args])
 
 
-@dataclass
+@dataclass(slots=True)
 class Line:
     parts: Sequence[Command]
 
@@ -425,10 +560,10 @@ class Line:
         return f'==> {joined}'
 
     def __bytes__(self) -> bytes:
-        return b''.join(bytes(cmd) for cmd in self.parts) + b'\xFF'
+        return b''.join([bytes(cmd) for cmd in self.parts]) + b'\xFF'
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     number: int
     parts: 'Sequence[Line | ObjDefintion]'
@@ -440,18 +575,22 @@ class Table:
         yield from (part.resolve(all_strings) for part in self.parts)
 
     def __bytes__(self) -> bytes:
-        out = bytearray(self.number.to_bytes(2, byteorder='big', signed=False))
+        chunks = [UINT16BE.pack(self.number)]
+        write = chunks.append
         it = iter(self.parts)
         for seq in it:
-            out += b'\0\0'
+            write(b'\0\0')
+            write(bytes(seq))
             if isinstance(seq, ObjDefintion):
-                out += bytes(seq) + bytes(next(it))
-            else:
-                out += bytes(seq)
-        return bytes(out + b'\0\1')
+                write(bytes(next(it)))
+        write(b'\0\1')
+        return b''.join(chunks)
 
 
-@dataclass
+OBJ_DEFINITION = struct.Struct('>3H')
+
+
+@dataclass(slots=True)
 class ObjDefintion:
     verb: int
     noun1: int
@@ -461,11 +600,7 @@ class ObjDefintion:
         return f'==> DEF: {self.verb:=} {self.noun1:=} {self.noun2:=}'
 
     def __bytes__(self) -> bytes:
-        return (
-            self.verb.to_bytes(2, byteorder='big', signed=False)
-            + self.noun1.to_bytes(2, byteorder='big', signed=False)
-            + self.noun2.to_bytes(2, byteorder='big', signed=False)
-        )
+        return OBJ_DEFINITION.pack(self.verb, self.noun1, self.noun2)
 
 
 def load_tables(
@@ -473,200 +608,260 @@ def load_tables(
     parser: 'Parser',
     soundmap: dict[int, set[int]] | None = None,
 ) -> 'Iterator[Table]':
+    start = stream.tell()
+    buf = memoryview(stream.read())
+    offset = 0
+    unpack_u16 = UINT16BE.unpack_from
+    unpack_definition = OBJ_DEFINITION.unpack_from
     while True:
-        try:
-            if read_uint16be(stream) != 0:
-                break
-        except struct.error:
+        if len(buf) - offset < UINT16BE.size:
+            stream.seek(start + len(buf))
+            break
+        (tag,) = unpack_u16(buf, offset)
+        offset += UINT16BE.size
+        if tag != 0:
+            stream.seek(start + offset)
             break
 
-        number = read_uint16be(stream)
-        yield Table(number, list(load_table(stream, number, parser, soundmap=soundmap)))
+        (number,) = unpack_u16(buf, offset)
+        offset += UINT16BE.size
+        parts: list[Line | ObjDefintion] = []
+        append = parts.append
+        while unpack_u16(buf, offset)[0] == 0:
+            offset += UINT16BE.size
+            if number == 0:
+                verb, noun1, noun2 = unpack_definition(buf, offset)
+                offset += OBJ_DEFINITION.size
+                append(ObjDefintion(verb, noun1, noun2))
+
+            commands, offset = decode_script(buf, offset, parser, soundmap=soundmap)
+            append(Line(commands))
+        offset += UINT16BE.size
+        stream.seek(start + offset)
+        yield Table(number, parts)
+
+
+def read_text_param(
+    buf: memoryview,
+    offset: int,
+    ptype: str,
+    text_mask: int,
+) -> tuple[Param, int]:
+    num = TEXT_TAGS[UINT16BE.unpack_from(buf, offset)[0]]
+    offset += UINT16BE.size
+    if num == 1:
+        (num,) = UINT32BE.unpack_from(buf, offset)
+        offset += UINT32BE.size
+    return Param(ptype, num, text_mask), offset
 
 
-def load_table(
-    stream: IO[bytes],
-    number: int,
-    parser: 'Parser',
-    soundmap: dict[int, set[int]] | None = None,
-) -> 'Iterator[Line | ObjDefintion]':
-    while True:
-        if read_uint16be(stream) != 0:
-            break
+# decoded params are never mutated, so repeated values share one instance
+SHARED_PARAMS: dict[tuple[str, int], Param] = {}
 
-        if number == 0:
-            verb = read_uint16be(stream)
-            noun1 = read_uint16be(stream)
-            noun2 = read_uint16be(stream)
-            yield ObjDefintion(verb, noun1, noun2)
 
-        yield Line(list(decode_script(stream, parser, soundmap=soundmap)))
+def shared_param(ptype: str, num: int) -> Param:
+    param = SHARED_PARAMS.get((ptype, num))
+    if param is None:
+        param = SHARED_PARAMS[ptype, num] = Param(ptype, num)
+    return param
 
 
-def realize_params(
-    params: 'Iterable[str]',
-    stream: IO[bytes],
+def read_byte_param(
+    buf: memoryview,
+    offset: int,
+    ptype: str,
     text_mask: int,
-) -> 'Iterator[Param]':
-    for ptype in params:
-        if ptype == ' ':
-            continue
-        if ptype == 'T':
-            rtypes = {
-                0: -1,
-                3: -3,
-                1: 1,
-            }
-            num = rtypes[read_uint16be(stream)]
-            if num == 1:
-                num = read_uint32be(stream)
-            yield Param(ptype, num, text_mask)
-            continue
+) -> tuple[Param, int]:
+    num = buf[offset]
+    if num == BYTE_MASK:
+        return Param(ptype, [buf[offset + 1]]), offset + 2
+    return shared_param(ptype, num), offset + 1
 
-        if ptype == 'B':
-            num = ord(stream.read(1))
-            yield (
-                Param(ptype, [ord(stream.read(1))])
-                if num == BYTE_MASK
-                else Param(ptype, num)
-            )
-            continue
 
-        if ptype == 'I':
-            num = read_uint16be(stream)
-            special_items = {
-                1: '$1',  # SUBJECT_ITEM
-                3: '$2',  # OBJECT_ITEM
-                5: '$ME',  # ME_ITEM
-                7: '$AC',  # ACTOR_ITEM
-                9: '$RM',  # ITEM_A_PARENT
-            }
-            special = special_items.get(num, None)
-            if special is not None:
-                yield Param(ptype, special)
-            else:
-                assert num == 0, num
-                num = read_uint32be(stream) + 2
-                assert num & WORD_MASK == num, (num & WORD_MASK, num)
-                yield Param(ptype, f'<{num}>')
-            continue
+SPECIAL_ITEM_PARAMS = {num: Param('I', name) for num, name in ITEM_TAGS.items()}
 
-        if ptype in {
-            'v',
-            'p',
-            'n',
-            'a',
-            'S',
-            'N',
-        }:
-            num = read_uint16be(stream)
-            yield Param(ptype, num)
-            continue
 
-        raise NotImplementedError(ptype)
+def read_item_param(
+    buf: memoryview,
+    offset: int,
+    ptype: str,
+    text_mask: int,
+) -> tuple[Param, int]:
+    (num,) = UINT16BE.unpack_from(buf, offset)
+    offset += UINT16BE.size
+    special = SPECIAL_ITEM_PARAMS.get(num)
+    if special is not None:
+        return special, offset
+    assert num == 0, num
+    (num,) = UINT32BE.unpack_from(buf, offset)
+    num += 2
+    assert num & WORD_MASK == num, (num & WORD_MASK, num)
+    return Param(ptype, f'<{num}>'), offset + UINT32BE.size
+
+
+def read_word_param(
+    buf: memoryview,
+    offset: int,
+    ptype: str,
+    text_mask: int,
+) -> tuple[Param, int]:
+    (num,) = UINT16BE.unpack_from(buf, offset)
+    return shared_param(ptype, num), offset + UINT16BE.size
+
+
+PARAM_READERS: dict[str, 'ParamReader'] = {
+    'T': read_text_param,
+    'B': read_byte_param,
+    'I': read_item_param,
+    **dict.fromkeys(WORD_PTYPES, read_word_param),
+}
+
+
+def realize_params(
+    readers: 'Iterable[tuple[str, ParamReader]]',
+    buf: memoryview,
+    offset: int,
+    text_mask: int,
+) -> tuple[tuple[Param, ...], int]:
+    args: list[Param] = []
+    for ptype, read in readers:
+        param, offset = read(buf, offset, ptype, text_mask)
+        args.append(param)
+    return tuple(args), offset
 
 
 def decode_script(
-    stream: IO[bytes],
+    buf: memoryview,
+    offset: int,
     parser: 'Parser',
     soundmap: dict[int, set[int]] | None = None,
-) -> 'Iterator[Command]':
+) -> tuple[list[Command], int]:
+    optable = parser.optable
+    readers = parser.readers
+    packers = parser.packers
+    sound_params = parser.sound_params
+    text_mask = parser.text_mask
+    commands: list[Command] = []
     while True:
-        pos = stream.tell()
-        opcode = ord(stream.read(1))
+        opcode = buf[offset]
+        offset += 1
         if opcode == BYTE_MASK:
             break
-        cmd, params = parser.optable[opcode]
-        args = tuple(realize_params(params, stream, parser.text_mask))
-        c = Command(opcode, cmd, args)
-        npos = stream.tell()
-        yield c
-        stream.seek(pos)
-        assert stream.read(npos - pos) == bytes(c)
-        if soundmap is not None and 'S' in params:
-            assert 'T' in params, params
-            soundmap[int(args[params.index('T')].value) & WORD_MASK].add(
-                int(args[params.index('S')].value),
+        cmd, _ = optable[opcode]
+        args, offset = realize_params(readers[opcode], buf, offset, text_mask)
+        commands.append(Command(opcode, cmd, args, packers.get(opcode)))
+        if soundmap is not None and opcode in sound_params:
+            text_idx, sound_idx = sound_params[opcode]
+            soundmap[int(args[text_idx].value) & WORD_MASK].add(
+                int(args[sound_idx].value),
             )
+    return commands, offset
 
 
-def parse_args(
-    cmds: 'Iterator[str]',
-    params: 'Iterable[str]',
-    text_mask: int,
-) -> 'Iterator[Param]':
-    for ptype in params:
-        if ptype == ' ':
-            continue
-        if ptype == 'T':
-            num = int(next(cmds))
-            if num >= BASE_MIN:
-                num |= text_mask
-            yield Param(ptype, num, text_mask)
-            continue
+def parse_text_param(token: str, ptype: str, text_mask: int) -> Param:
+    num = int(token)
+    if num >= BASE_MIN:
+        num |= text_mask
+    return Param(ptype, num, text_mask)
 
-        if ptype == 'B':
-            rnum = next(cmds)
-            stripped = rnum.strip('[]')
-            if stripped != rnum:
-                yield Param(ptype, [int(stripped)])
-            else:
-                yield Param(ptype, int(rnum))
-            continue
 
-        if ptype == 'I':
-            yield Param(ptype, next(cmds))
-            continue
+def parse_byte_param(token: str, ptype: str, text_mask: int) -> Param:
+    stripped = token.strip('[]')
+    if stripped != token:
+        return Param(ptype, [int(stripped)])
+    return Param(ptype, int(token))
 
-        if ptype in {
-            'v',
-            'p',
-            'n',
-            'a',
-            'S',
-            'N',
-        }:
-            yield Param(ptype, int(next(cmds)))
-            continue
+
+def parse_item_param(token: str, ptype: str, text_mask: int) -> Param:
+    if token not in SPECIAL_ITEMS and (
+        token[:1] != '<' or token[-1:] != '>' or int(token[1:-1]) not in ITEM_NUMBERS
+    ):
+        raise ValueError(token)
+    return Param(ptype, token)
+
+
+def parse_word_param(token: str, ptype: str, text_mask: int) -> Param:
+    return Param(ptype, int(token))
+
+
+PARAM_PARSERS: dict[str, 'Callable[[str, str, int], Param]'] = {
+    'T': parse_text_param,
+    'B': parse_byte_param,
+    'I': parse_item_param,
+    **dict.fromkeys(WORD_PTYPES, parse_word_param),
+}
 
 
 @dataclass
 class Parser:
     optable: 'Mapping[int, tuple[str | None, str]]' = field(repr=False)
     text_mask: int = 0
+    packers: 'Mapping[int, struct.Struct]' = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    readers: 'Mapping[int, tuple[tuple[str, ParamReader], ...]]' = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    arg_counts: 'Mapping[int, int]' = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    keywords: 'Mapping[str, int]' = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    key_ops: 'Mapping[str, int]' = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    sound_params: 'Mapping[int, tuple[int, int]]' = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    text_params: 'Mapping[int, tuple[int, ...]]' = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
-
-def tokenize_cmds(
-    cmds: 'Iterable[str]',
-    parser: 'Parser',
-) -> 'Iterable[tuple[int, str, Sequence[str]]]':
-    keywords = {command: op for op, (command, _) in parser.optable.items()}
-    key = None
-    command = None
-    params = []
-    for token in cmds:
-        if token.startswith('(0x') and token.endswith(')'):
-            if key is not None:
-                params.append(key)
-            key = token
-        elif token in keywords:
-            if command is not None:
-                yield (keywords[command], command, params)
-                params = []
-            command = token
-            # Check if current keyword matches key
-            if key is not None and keywords[command] != int(key.strip('()'), 16):
-                raise OpcodeCommandMismatchError(key, keywords[command], command)
-            key = None
-        else:
-            if key is not None:
-                params.append(key)
-            params.append(token)
-            key = None
-            if command is None:
-                raise UnrecognizedCommandError(token)
-    if command is not None:
-        yield (keywords[command], command, params)
+    def __post_init__(self) -> None:
+        # commands with only word-sized params serialize with a single pack
+        self.packers = {}
+        self.sound_params = {}
+        self.text_params = {}
+        for op, (_, params) in self.optable.items():
+            ptypes = params.replace(' ', '')
+            if 'T' in ptypes:
+                self.text_params[op] = tuple(
+                    idx for idx, ptype in enumerate(ptypes) if ptype == 'T'
+                )
+            if WORD_PTYPES.issuperset(ptypes):
+                self.packers[op] = struct.Struct(f'>B{len(ptypes)}H')
+            if 'S' in ptypes:
+                assert 'T' in ptypes, params
+                self.sound_params[op] = (ptypes.index('T'), ptypes.index('S'))
+        self.readers = {
+            op: tuple((ptype, PARAM_READERS[ptype]) for ptype in params if ptype != ' ')
+            for op, (_, params) in self.optable.items()
+        }
+        self.arg_counts = {
+            op: len(params.rstrip(' ')) for op, (_, params) in self.optable.items()
+        }
+        self.keywords = {
+            command: op
+            for op, (command, _) in self.optable.items()
+            if command is not None
+        }
+        # opcode keys as written by the dumper, other spellings are parsed
+        self.key_ops = {f'(0x{op:02x})': op for op in self.optable}
 
 
 class ParseError(ValueError):
@@ -693,8 +888,15 @@ class ParseError(ValueError):
         self.sargs = sargs
 
     def highlight(self, linetab: str) -> str:
-        focus = ' '.join([self.command, *self.sargs])
-        return linetab.replace(focus, f'-> {focus} <-', 1)
+        return self.mark(linetab, ' '.join([self.command, *self.sargs]))
+
+    @staticmethod
+    def mark(linetab: str, focus: str) -> str:
+        idx = linetab.find(focus)
+        if idx < 0:
+            return linetab
+        end = idx + len(focus)
+        return f'{linetab[:idx]}-> {focus} <-{linetab[end:]}'
 
     def show(self, scr_file: str) -> None:
         print('ERROR: Cannot parse scripts file at', file=self.stream)
@@ -733,8 +935,7 @@ class OpcodeCommandMismatchError(ParseError):
         self.expected = expected
 
     def highlight(self, linetab: str) -> str:
-        focus = f'{self.key} {self.command}'
-        return linetab.replace(focus, f'-> {focus} <-', 1)
+        return self.mark(linetab, f'{self.key} {self.command}')
 
 
 class ParameterCountMismatchError(ParseError):
@@ -800,31 +1001,82 @@ class InvalidTextReferenceError(ParseError):
         self.text_id = text_id
 
     def highlight(self, linetab: str) -> str:
-        focus = str(self.text_id)
-        return linetab.replace(focus, f'-> {focus} <-', 1)
+        return self.mark(linetab, str(self.text_id))
 
 
-def parse_cmds(
-    cmds: 'Iterable[str]',
+def command_parser(
     parser: 'Parser',
     text_range: range,
-) -> 'Iterator[Command]':
-    for op, command, args in tokenize_cmds(cmds, parser):
-        ename, params = parser.optable[op]
+) -> 'Callable[[int, str, Sequence[str]], Command]':
+    optable = parser.optable
+    arg_counts = parser.arg_counts
+    packers = parser.packers
+    text_params = parser.text_params
+    text_mask = parser.text_mask
+    parsers = PARAM_PARSERS
+
+    def parse_command(op: int, command: str, args: 'Sequence[str]') -> Command:
+        ename, params = optable[op]
         assert command == ename, (command, ename)
-        if len(args) != len(params.rstrip(' ')):
+        if len(args) != arg_counts[op]:
             raise ParameterCountMismatchError(command, args, params)
+        tokens = iter(args)
+        parsed: list[Param] = []
+        append = parsed.append
         try:
-            parsed = tuple(parse_args(iter(args), params, parser.text_mask))
+            for ptype in params:
+                if ptype != ' ':
+                    append(parsers[ptype](next(tokens), ptype, text_mask))
         except ValueError as exc:
             raise ArgumentParseError(command, args, params, exc) from exc
-        for p in parsed:
-            if p.ptype != 'T':
-                continue
+        for idx in text_params.get(op, ()):
+            p = parsed[idx]
             text_ref = p.value & ~p.mask
             if text_ref >= BASE_MIN and text_ref not in text_range:
                 raise InvalidTextReferenceError(command, args, text_ref, text_range)
-        yield Command(op, command, parsed)
+        return Command(op, command, tuple(parsed), packers.get(op))
+
+    return parse_command
+
+
+def parse_cmds(
+    cmds: 'Iterable[str]',
+    parser: 'Parser',
+    text_range: range,
+) -> 'Iterator[Command]':
+    parse_command = command_parser(parser, text_range)
+    keywords = parser.keywords
+    key_ops = parser.key_ops
+    key = None
+    command = None
+    op = 0
+    args: list[str] = []
+    for token in cmds:
+        if token.startswith('(0x') and token.endswith(')'):
+            if key is not None:
+                args.append(key)
+            key = token
+            continue
+        token_op = keywords.get(token)
+        if token_op is not None:
+            if command is not None:
+                yield parse_command(op, command, args)
+                args = []
+            command = token
+            op = token_op
+            # Check if current keyword matches key
+            if key is not None and key_ops.get(key) != op and op != int(key[1:-1], 16):
+                raise OpcodeCommandMismatchError(key, op, command)
+            key = None
+        else:
+            if key is not None:
+                args.append(key)
+            args.append(token)
+            key = None
+            if command is None:
+                raise UnrecognizedCommandError(token)
+    if command is not None:
+        yield parse_command(op, command, args)
 
 
 def parse_lines(
@@ -840,7 +1092,8 @@ def parse_lines(
             yield ObjDefintion(*(int(x) for x in tab.split()[1:]))
             line_number += tab.count('\n')
             continue
-        cmds = ''.join(x.split('//')[0] for x in tab.split('\n')).split()
+        rows = tab.split('\n')
+        cmds = ''.join([row.partition('//')[0] for row in rows]).split()
         try:
             yield Line(list(parse_cmds(cmds, parser, text_range)))
         except ParseError as exc:
@@ -848,7 +1101,7 @@ def parse_lines(
             exc.line = bidx
             exc.linetab = '==>\t' + tab
             raise
-        line_number += tab.count('\n')
+        line_number += len(rows) - 1
 
 
 def parse_tables(
@@ -869,52 +1122,69 @@ def parse_tables(
         line_number += line.count('\n')
 
 
+def parse_object_property(aprops: dict[str, str]) -> ObjectProperty:
+    property_types = PropertyType.__members__
+    name = Param('T', int(aprops.pop('NAME')))
+    params: 'dict[PropertyType, int | Param]' = {
+        property_types[pkey]: int(val) for pkey, val in aprops.items()
+    }
+    desc = params.get(PropertyType.DESCRIPTION)
+    if desc is not None:
+        params[PropertyType.DESCRIPTION] = Param('T', desc)
+    return {'ptype': ItemType.OBJECT, 'name': name, 'params': params}
+
+
+def parse_room(aprops: dict[str, str]) -> RoomProperty:
+    door_states = DoorState.__members__
+    exits: list[Exit | None] = []
+    for key in EXIT_KEYS:
+        exd = aprops[key]
+        ex: Exit | None
+        if exd == '-':
+            ex = None
+        else:
+            eto, status = exd.split()
+            ex = {'exit_to': int(eto), 'status': door_states[status]}
+        exits.append(ex)
+    return {
+        'ptype': ItemType.ROOM,
+        'table': int(aprops['TABLE']),
+        'exits': exits,
+    }
+
+
+def parse_inherit(aprops: dict[str, str]) -> InheritProperty:
+    return {
+        'ptype': ItemType.INHERIT,
+        'item': int(aprops['ITEM']),
+    }
+
+
+def parse_user_flag(aprops: dict[str, str]) -> UserFlagProperty:
+    return {
+        'ptype': ItemType.USERFLAG,
+        'flag1': int(aprops['1']),
+        'flag2': int(aprops['2']),
+        'flag3': int(aprops['3']),
+        'flag4': int(aprops['4']),
+    }
+
+
+PROPERTY_PARSERS: 'Mapping[ItemType, Callable[[dict[str, str]], Property]]' = {
+    ItemType.ROOM: parse_room,
+    ItemType.OBJECT: parse_object_property,
+    ItemType.USERFLAG: parse_user_flag,
+    ItemType.INHERIT: parse_inherit,
+}
+
+
 def parse_props(props: 'Iterable[str]') -> 'Iterator[Property]':
+    item_types = ItemType.__members__
     for prop in props:
         rdtype, *rprops = prop.rstrip('\n').split('\n\t')
-        dtype = ItemType[rdtype]
-        aprops = dict(x.split(' //')[0].split(maxsplit=1) for x in rprops)
-        dprops: Property
-        if dtype == ItemType.OBJECT:
-            dprops = {
-                'ptype': ItemType.OBJECT,
-                'name': Param('T', int(aprops.pop('NAME'))),
-                'params': {
-                    PropertyType[pkey]: int(val) for pkey, val in aprops.items()
-                },
-            }
-            desc = dprops['params'].get(PropertyType.DESCRIPTION)
-            if desc is not None:
-                dprops['params'][PropertyType.DESCRIPTION] = Param('T', desc)
-        elif dtype == ItemType.ROOM:
-            exits = []
-            for i in range(6):
-                exd = aprops[f'EXIT{1+i}']
-                ex: Exit | None
-                if exd == '-':
-                    ex = None
-                else:
-                    eto, status = exd.split()
-                    ex = {'exit_to': int(eto), 'status': DoorState[status]}
-                exits.append(ex)
-            dprops = {
-                'ptype': ItemType.ROOM,
-                'table': int(aprops['TABLE']),
-                'exits': exits,
-            }
-        elif dtype == ItemType.INHERIT:
-            dprops = {
-                'ptype': ItemType.INHERIT,
-                'item': int(aprops['ITEM']),
-            }
-        elif dtype == ItemType.USERFLAG:
-            dprops = {
-                'ptype': ItemType.USERFLAG,
-                'flag1': int(aprops['1']),
-                'flag2': int(aprops['2']),
-                'flag3': int(aprops['3']),
-                'flag4': int(aprops['4']),
-            }
-        else:
+        dtype = item_types[rdtype]
+        aprops = dict(x.partition(' //')[0].split(maxsplit=1) for x in rprops)
+        parse = PROPERTY_PARSERS.get(dtype)
+        if parse is None:
             raise ValueError(dtype)
-        yield dprops
+        yield parse(aprops)
@@ -34,6 +34,7 @@ from magos.chiper import (
 from magos.gamepc import read_gamepc, write_gamepc
 from magos.gamepc_script import (
     BASE_MIN,
+    EXIT_KEYS,
     Item,
     ItemType,
     Param,
@@ -179,61 +180,58 @@ def write_objects(
     output = Path(output)
     with output.open('w', **encoding) as output_file:
         for obj in objects:
-            print(
-                '== DEFINE {} {} {} {} {} {} {} {} {} =='.format(
-                    obj['adjective'],
-                    obj['noun'],
-                    obj['state'],
-                    obj['next_item'],
-                    obj['child'],
-                    obj['parent'],
-                    obj['unk'],
-                    obj['item_class'],
-                    obj['properties_init'],
+            lines = [
+                '== DEFINE {} {} {} {} {} {} {} {} {} ==\n'.format(
+                    obj.adjective,
+                    obj.noun,
+                    obj.state,
+                    obj.next_item,
+                    obj.child,
+                    obj.parent,
+                    obj.unk,
+                    obj.item_class,
+                    obj.properties_init,
                 ),
-                file=output_file,
-            )
-            for prop in obj['properties']:
-                print(f'==> {prop["ptype"].name}', file=output_file)
+            ]
+            for prop in obj.properties:
+                lines.append(f'==> {prop["ptype"].name}\n')
                 if prop['ptype'] == ItemType.OBJECT:
-                    print(
-                        '\tNAME',
-                        prop['name'].value,
-                        '//',
-                        prop['name'].resolve(all_strings),
-                        file=output_file,
+                    name = prop['name']
+                    lines.append(
+                        f'\tNAME {name.value} // {name.resolve(all_strings)}\n',
                     )
-                    description = prop['params'].pop(PropertyType.DESCRIPTION, None)
-                    if description:
+                    description = prop['params'].get(PropertyType.DESCRIPTION)
+                    if description is not None:
                         assert isinstance(description, Param)
-                        print(
-                            '\tDESCRIPTION',
-                            description.value,
-                            '//',
-                            description.resolve(all_strings),
-                            file=output_file,
+                        lines.append(
+                            f'\tDESCRIPTION {description.value}'
+                            f' // {description.resolve(all_strings)}\n',
                         )
-                    for pkey, pval in prop['params'].items():
-                        print(f'\t{pkey.name}', pval, file=output_file)
+                    lines.extend(
+                        f'\t{pkey.name} {pval}\n'
+                        for pkey, pval in prop['params'].items()
+                        if pkey != PropertyType.DESCRIPTION
+                    )
                 elif prop['ptype'] == ItemType.ROOM:
-                    print('\tTABLE', prop['table'], file=output_file)
-                    for idx, ex in enumerate(prop['exits']):
-                        print(
-                            f'\tEXIT{1+idx}',
-                            f"{ex['exit_to']} {ex['status'].name}"
-                            if ex is not None
-                            else '-',
-                            file=output_file,
-                        )
+                    lines.append(f'\tTABLE {prop["table"]}\n')
+                    lines.extend(
+                        f"\t{key} {ex['exit_to']} {ex['status'].name}\n"
+                        if ex is not None
+                        else f'\t{key} -\n'
+                        for key, ex in zip(EXIT_KEYS, prop['exits'], strict=True)
+                    )
                 elif prop['ptype'] == ItemType.INHERIT:
-                    print('\tITEM', prop['item'], file=output_file)
+                    lines.append(f'\tITEM {prop["item"]}\n')
                 elif prop['ptype'] == ItemType.USERFLAG:
-                    print('\t1', prop['flag1'], file=output_file)
-                    print('\t2', prop['flag2'], file=output_file)
-                    print('\t3', prop['flag3'], file=output_file)
-                    print('\t4', prop['flag4'], file=output_file)
+                    lines.append(
+                        f'\t1 {prop["flag1"]}\n'
+                        f'\t2 {prop["flag2"]}\n'
+                        f'\t3 {prop["flag3"]}\n'
+                        f'\t4 {prop["flag4"]}\n',
+                    )
                 else:
                     raise ValueError(prop)
+            output_file.write(''.join(lines))
 
 
 def load_objects(objects_file: IO[str]) -> 'Iterator[Item]':
@@ -242,27 +240,28 @@ def load_objects(objects_file: IO[str]) -> 'Iterator[Item]':
     assert not blank, blank
     for do in defs:
         rlidx, *props = do.split('==> ')
-        lidx = [int(x) for x in rlidx.split('==')[0].split() if x]
-        yield cast(
-            Item,
-            dict(
-                zip(
-                    (
-                        'adjective',
-                        'noun',
-                        'state',
-                        'next_item',
-                        'child',
-                        'parent',
-                        'unk',
-                        'item_class',
-                        'properties_init',
-                        'properties',
-                    ),
-                    (*lidx, list(parse_props(props))),
-                    strict=True,
-                ),
-            ),
+        (
+            adjective,
+            noun,
+            state,
+            next_item,
+            child,
+            parent,
+            unk,
+            item_class,
+            properties_init,
+        ) = (int(x) for x in rlidx.split('==')[0].split() if x)
+        yield Item(
+            adjective=adjective,
+            noun=noun,
+            state=state,
+            next_item=next_item,
+            child=child,
+            parent=parent,
+            unk=unk,
+            item_class=item_class,
+            properties_init=properties_init,
+            properties=list(parse_props(props)),
         )
 
 
@@ -736,8 +735,8 @@ def rebuild(
 
         base_tables = btables.pop(game.basefile)
         with io.BytesIO(game.gbi.tables) as tbl_file:
+            # skip the original objects and tables to find trailing data
             _orig_objects = read_objects(tbl_file, game.gbi.item_count)
-            _pref = game.gbi.tables[: tbl_file.tell()]
             _orig = list(load_tables(tbl_file, gparser))
             leftover = tbl_file.read()
 
@@ -0,0 +1,129 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from magos.chiper import RAW_BYTE_ENCODING
+from magos.gamepc_script import (
+    ITEM_HEADER,
+    DoorState,
+    Item,
+    ItemType,
+    Param,
+    PropertyType,
+    read_objects,
+    write_objects_bytes,
+)
+from magos.magos import load_objects, write_objects
+
+
+@pytest.fixture()
+def objects() -> list[Item]:
+    return [
+        Item(
+            adjective=1,
+            noun=2,
+            state=3,
+            next_item=0,
+            child=5,
+            parent=0,
+            unk=7,
+            item_class=8,
+            properties_init=1,
+            properties=[
+                {
+                    'ptype': ItemType.ROOM,
+                    'table': 10,
+                    'exits': [
+                        {'exit_to': 3, 'status': DoorState.OPEN},
+                        None,
+                        None,
+                        {'exit_to': 4, 'status': DoorState.LOCKED},
+                        None,
+                        None,
+                    ],
+                },
+                {'ptype': ItemType.INHERIT, 'item': 6},
+            ],
+        ),
+        Item(
+            adjective=0,
+            noun=0,
+            state=0,
+            next_item=2,
+            child=0,
+            parent=4,
+            unk=0,
+            item_class=0,
+            properties_init=0,
+            properties=[],
+        ),
+        Item(
+            adjective=9,
+            noun=10,
+            state=0,
+            next_item=0,
+            child=0,
+            parent=2,
+            unk=0,
+            item_class=1,
+            properties_init=2,
+            properties=[
+                {
+                    'ptype': ItemType.OBJECT,
+                    'name': Param('T', 42),
+                    'params': {
+                        PropertyType.DESCRIPTION: Param('T', 43),
+                        PropertyType.SIZE: 2,
+                        PropertyType.VOICE: 17,
+                        PropertyType.FLAGS: 5,
+                    },
+                },
+                {
+                    'ptype': ItemType.USERFLAG,
+                    'flag1': 1,
+                    'flag2': 2,
+                    'flag3': 3,
+                    'flag4': 4,
+                },
+            ],
+        ),
+    ]
+
+
+def test_objects_bytes_roundtrip(objects: list[Item]) -> None:
+    """
+    Given a sequence of items with every supported property type,
+    When the items are serialized and read back,
+    Then the decoded items should equal the original ones
+    and the stream should be positioned right after the last item.
+    """
+    data = write_objects_bytes(objects)
+    with io.BytesIO(data + b'tables') as stream:
+        assert read_objects(stream, len(objects) + 2) == objects
+        assert stream.read() == b'tables'
+
+
+def test_objects_text_roundtrip(objects: list[Item], tmp_path: Path) -> None:
+    """
+    Given a sequence of items,
+    When the items are written as text and loaded back,
+    Then the loaded items should serialize to the same bytes as the original ones.
+    """
+    expected = write_objects_bytes(objects)
+    write_objects(objects, tmp_path / 'objects.txt', {}, RAW_BYTE_ENCODING)
+    with (tmp_path / 'objects.txt').open('r', **RAW_BYTE_ENCODING) as objects_file:
+        loaded = list(load_objects(objects_file))
+    assert write_objects_bytes(loaded) == expected
+    assert write_objects_bytes(objects) == expected
+
+
+def test_objects_unknown_property_type() -> None:
+    """
+    Given an item with a property tag that is not a known item type,
+    When the item is read,
+    Then a ValueError naming the tag should be raised.
+    """
+    data = ITEM_HEADER.pack(0, 0, 0, 0, 0, 0, 0, 0, 1) + b'\x00\x05'
+    with io.BytesIO(data) as stream, pytest.raises(ValueError, match='^5$'):
+        read_objects(stream, 3)
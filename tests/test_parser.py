@@ -31,21 +31,21 @@ def parser() -> Parser:
     [
         '''
         VC_EMPTY
-        VC_I 7
-        VC_IB 2 3
+        VC_I <7>
+        VC_IB <2> 3
         VC_NT 10 12
         ''',
-        'VC_EMPTY VC_I 7 VC_IB 2 3 VC_NT 10 12',
+        'VC_EMPTY VC_I <7> VC_IB <2> 3 VC_NT 10 12',
         '''
         (0x00) VC_EMPTY
-        VC_I 7
-        VC_IB 2 3 (0x03) VC_NT 10 12
+        VC_I <7>
+        VC_IB <2> 3 (0x03) VC_NT 10 12
         ''',
         '''
         (0x00) VC_EMPTY
-        (0x01) VC_I 7
+        (0x01) VC_I <7>
         (0x02)
-        VC_IB 2
+        VC_IB <2>
         3
 
         (0x03) VC_NT 10 12
@@ -68,8 +68,8 @@ def test_valid_cmds(parser: Parser, script: str) -> None:
     text_range = range(BASE_MIN, BASE_MIN + 100)
     expected_output = [
         Command(0x00, 'VC_EMPTY', ()),
-        Command(0x01, 'VC_I', (Param('I', '7'),)),
-        Command(0x02, 'VC_IB', (Param('I', '2'), Param('B', 3))),
+        Command(0x01, 'VC_I', (Param('I', '<7>'),)),
+        Command(0x02, 'VC_IB', (Param('I', '<2>'), Param('B', 3))),
         Command(0x03, 'VC_NT', (Param('N', 10), Param('T', 12))),
     ]
     assert list(parse_cmds(script.split(), parser, text_range)) == expected_output
@@ -84,8 +84,8 @@ def test_opcode_mismatch(parser: Parser) -> None:
     """
     script = '''
         (0x01) VC_EMPTY
-        VC_I 7
-        VC_IB 2 3
+        VC_I <7>
+        VC_IB <2> 3
         (0x03) VC_NT 10 12
     '''
     text_range = range(BASE_MIN, BASE_MIN + 100)
@@ -107,7 +107,7 @@ def test_invalid_cmd(parser: Parser) -> None:
     """
     script = '''
         INVC_EMPTY
-        VC_I 7
+        VC_I <7>
     '''
     text_range = range(BASE_MIN, BASE_MIN + 100)
     with pytest.raises(UnrecognizedCommandError) as excinfo:
@@ -124,24 +124,24 @@ def test_invalid_arg(parser: Parser) -> None:
     error message highlighting the command with the invalid argument.
     """
     script = '''
-        VC_I 7
-        VC_IB 2 string
+        VC_I <7>
+        VC_IB <2> string
         VC_NT 10 12
     '''
     text_range = range(BASE_MIN, BASE_MIN + 100)
     with pytest.raises(ArgumentParseError) as excinfo:
         list(parse_cmds(script.split(), parser, text_range))
     assert excinfo.value.args[0].startswith(
-        'could not parse given arguments 2 string as types IB',
+        'could not parse given arguments <2> string as types IB',
     )
-    assert '-> VC_IB 2 string <-' in excinfo.value.highlight(script)
+    assert '-> VC_IB <2> string <-' in excinfo.value.highlight(script)
 
 
 @pytest.mark.parametrize(
     'args',
     [
-        '2',
-        '2 3 4',
+        '<2>',
+        '<2> 3 4',
     ],
     ids=['fewer_args', 'extra_args'],
 )
@@ -157,7 +157,7 @@ def test_invalid_arg_count(parser: Parser, args: str) -> None:
     - Command with more parameters (3) than expected (2).
     """
     script = f'''
-        VC_I 7
+        VC_I <7>
         VC_IB {args}
         VC_NT 10 12
     '''
@@ -196,8 +196,8 @@ def test_invalid_text_ref(
     - Text reference above the loaded text range.
     """
     script = f'''
-        VC_I 7
-        VC_IB 2 3
+        VC_I <7>
+        VC_IB <2> 3
         VC_NT 10 {text_num}
         VC_NT 10 12
     '''
@@ -234,15 +234,78 @@ def test_valid_text_ref(
     """
     script = f'''
         VC_EMPTY
-        VC_I 7
-        VC_IB 2 3
+        VC_I <7>
+        VC_IB <2> 3
         VC_NT 10 {text_num}
     '''
     text_range = range(range_min, range_max)
     expected_output = [
         Command(0x00, 'VC_EMPTY', ()),
-        Command(0x01, 'VC_I', (Param('I', '7'),)),
-        Command(0x02, 'VC_IB', (Param('I', '2'), Param('B', 3))),
+        Command(0x01, 'VC_I', (Param('I', '<7>'),)),
+        Command(0x02, 'VC_IB', (Param('I', '<2>'), Param('B', 3))),
         Command(0x03, 'VC_NT', (Param('N', 10), Param('T', text_num))),
     ]
     assert list(parse_cmds(script.split(), parser, text_range)) == expected_output
+
+
+@pytest.mark.parametrize(
+    ('item', 'expected'),
+    [
+        ('<7>', b'\x01\x00\x00\x00\x00\x00\x05'),
+        ('$ME', b'\x01\x00\x05'),
+    ],
+    ids=['item_number', 'special_item'],
+)
+def test_item_ref_bytes(parser: Parser, item: str, expected: bytes) -> None:
+    """
+    Given a command with an item reference,
+    When the command is parsed and serialized,
+    Then the item reference should be encoded as in the game script.
+    """
+    text_range = range(BASE_MIN, BASE_MIN + 100)
+    (command,) = parse_cmds(['VC_I', item], parser, text_range)
+    assert bytes(command) == expected
+
+
+def test_item_ref_param_bytes(parser: Parser) -> None:
+    """
+    Given an item reference param built directly,
+    When it is compared with and serialized like a parsed one,
+    Then both should be equal and encode the same bytes.
+    """
+    text_range = range(BASE_MIN, BASE_MIN + 100)
+    (command,) = parse_cmds(['VC_I', '<7>'], parser, text_range)
+    param = Param('I', '<7>')
+    assert command.args == (param,)
+    assert bytes(param) == bytes(command.args[0]) == b'\x00\x00\x00\x00\x00\x05'
+
+
+def test_parser_equality(parser: Parser) -> None:
+    """
+    Given two parsers built from the same opcode table,
+    When they are compared,
+    Then they should be equal.
+    """
+    assert Parser(parser.optable) == parser
+
+
+@pytest.mark.parametrize(
+    'item',
+    ['zz', '7', '<zz>', '<1>', '<65536>'],
+    ids=['word', 'bare_number', 'not_a_number', 'below_range', 'above_range'],
+)
+def test_invalid_item_ref(parser: Parser, item: str) -> None:
+    """
+    Given a command with a malformed item reference,
+    When the command is parsed,
+    Then the parser should raise an `ArgumentParseError`
+    highlighting the command with the invalid reference.
+    """
+    script = f'''
+        VC_I <7>
+        VC_I {item}
+    '''
+    text_range = range(BASE_MIN, BASE_MIN + 100)
+    with pytest.raises(ArgumentParseError) as excinfo:
+        list(parse_cmds(script.split(), parser, text_range))
+    assert f'-> VC_I {item} <-' in excinfo.value.highlight(script)
@@ -0,0 +1,101 @@
+import io
+from collections import defaultdict
+
+import pytest
+
+from magos.gamepc_script import (
+    BASE_MIN,
+    Command,
+    Line,
+    ObjDefintion,
+    Param,
+    Parser,
+    Table,
+    load_tables,
+)
+
+# Opcode table covering every param reader
+opcode_table = {
+    0x00: ('VC_EMPTY', ' '),
+    0x01: ('VC_I', 'I '),
+    0x02: ('VC_IB', 'IB '),
+    0x03: ('VC_NT', 'NT '),
+    0x04: ('VC_TS', 'TS '),
+    0x05: ('VC_VPA', 'vpa '),
+}
+
+
+@pytest.mark.parametrize(
+    'text_mask',
+    [0, 0xFFFF0000],
+    ids=['no_mask', 'simon1_mask'],
+)
+def test_tables_bytes_roundtrip(text_mask: int) -> None:
+    """
+    Given tables with every kind of command parameter,
+    When the tables are serialized and read back,
+    Then the decoded tables should equal the original ones and serialize
+    to the same bytes, sound references should be collected in the soundmap,
+    and the stream should be positioned right after the end tag.
+    """
+    parser = Parser(opcode_table, text_mask)
+    text_ref = (BASE_MIN + 3) | text_mask
+    tables = [
+        Table(
+            0,
+            [
+                ObjDefintion(1, 2, 3),
+                Line(
+                    [
+                        Command(0x00, 'VC_EMPTY', ()),
+                        Command(0x01, 'VC_I', (Param('I', '$ME'),)),
+                        Command(0x02, 'VC_IB', (Param('I', '<77>'), Param('B', 3))),
+                    ],
+                ),
+                ObjDefintion(4, 5, 6),
+                Line([]),
+            ],
+        ),
+        Table(
+            7,
+            [
+                Line(
+                    [
+                        Command(
+                            0x02,
+                            'VC_IB',
+                            (Param('I', '$RM'), Param('B', [255])),
+                        ),
+                        Command(
+                            0x03,
+                            'VC_NT',
+                            (Param('N', 10), Param('T', -1, text_mask)),
+                        ),
+                        Command(
+                            0x03,
+                            'VC_NT',
+                            (Param('N', 11), Param('T', -3, text_mask)),
+                        ),
+                        Command(
+                            0x04,
+                            'VC_TS',
+                            (Param('T', text_ref, text_mask), Param('S', 42)),
+                        ),
+                        Command(
+                            0x05,
+                            'VC_VPA',
+                            (Param('v', 1), Param('p', 2), Param('a', 0xFFFF)),
+                        ),
+                    ],
+                ),
+            ],
+        ),
+    ]
+    data = b''.join(b'\0\0' + bytes(table) for table in tables)
+    soundmap: defaultdict[int, set[int]] = defaultdict(set)
+    with io.BytesIO(data + b'\0\1leftover') as stream:
+        decoded = list(load_tables(stream, parser, soundmap=soundmap))
+        assert decoded == tables
+        assert b''.join(b'\0\0' + bytes(table) for table in decoded) == data
+        assert soundmap == {BASE_MIN + 3: {42}}
+        assert stream.read() == b'leftover'